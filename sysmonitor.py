@@ -10,15 +10,445 @@ Usage:
 """
 
 import argparse
+import collections
+import dataclasses
+import glob
+import heapq
 import logging
 import logging.handlers
+import operator
 import os
+import queue
 import sys
 import time
-from typing import Dict, Optional
+import traceback
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple, Union
 
 import psutil
 
+# Timestamp format shared by log lines and the context lines replayed in them.
+_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# (monotonic ns, context template, template arguments); the first argument is always the
+# wall-clock time of the check, as a _WallClockTime.
+_HistoryEntry = Tuple[int, str, Tuple[Any, ...]]
+# (sensor, temperature) pairs sorted by sensor name
+_TempReadings = Tuple[Tuple[str, float], ...]
+# (sensor name, temp*_input files of that sensor), as discovered under /sys/class/hwmon
+_HwmonSensors = Tuple[Tuple[str, Tuple["_ProcFile", ...]], ...]
+# (device names, first counter per device, second counter per device)
+_DeviceCounters = Tuple[Tuple[str, ...], List[int], List[int]]
+
+
+def _scan_kv(buf: memoryview, key: bytes) -> int:
+    """Finds ``key`` in a /proc buffer and parses the integer that follows it.
+
+    Scans the underlying buffer in place, so no intermediate strings or lists are built.
+
+    Args:
+        buf (memoryview): A view starting at offset 0 of a ``bytearray``.
+        key (bytes): The key to search for, e.g. ``b"MemTotal:"``.
+
+    Returns:
+        int: The value following the key, or -1 if the key or a value is not present.
+    """
+    end = buf.nbytes
+    i = buf.obj.find(key, 0, end)
+    if i < 0:
+        return -1
+    i += len(key)
+    while i < end and not 48 <= buf[i] <= 57:  # Skip to the first digit.
+        i += 1
+    j = i
+    while j < end and 48 <= buf[j] <= 57:
+        j += 1
+    return int(buf[i:j]) if j > i else -1
+
+
+class _ProcFile:
+    """A /proc or /sys file kept open and re-read in place into its own preallocated buffer."""
+
+    def __init__(self, path: str, size: int = 8192, multi_record: bool = False) -> None:
+        """Opens the file and allocates its read buffer.
+
+        Args:
+            path (str): Path of the /proc or /sys file.
+            size (int): Initial buffer size in bytes; grown on demand.
+            multi_record (bool): Whether the file is a multi-record seq_file that may return
+                short reads before its end.
+        """
+        self.path = path
+        self.buf = bytearray(size)
+        self.multi_record = multi_record
+        self.fd = os.open(path, os.O_RDONLY | os.O_CLOEXEC)
+
+    def read(self) -> memoryview:
+        """Re-reads the whole file from the start into the buffer.
+
+        If the read fails, the file is reopened once and the read retried. If reopening
+        fails, the file is left closed (``fd`` is -1) and reopened on the next read.
+
+        Returns:
+            memoryview: A view of the file contents, valid until the next read.
+        """
+        if self.fd < 0:
+            self.fd = os.open(self.path, os.O_RDONLY | os.O_CLOEXEC)
+        try:
+            n = self._read_all()
+        except OSError as e:
+            logging.debug("Reopening %s after failed read: %s", self.path, e)
+            self.close()
+            self.fd = os.open(self.path, os.O_RDONLY | os.O_CLOEXEC)
+            n = self._read_all()
+        return memoryview(self.buf)[:n]
+
+    def _read_all(self) -> int:
+        """Reads positionally to the end of the file, growing the buffer whenever it fills.
+
+        A file that fits in the buffer takes a single preadv. Multi-record seq_files such as
+        /proc/diskstats and /proc/net/dev return roughly one page per read however large
+        the buffer is, so for those a short read does not mean the end of the file; only a
+        read returning 0 does.
+
+        Returns:
+            int: The number of bytes read.
+        """
+        buf = self.buf
+        n = 0
+        while True:
+            if n == len(buf):
+                buf.extend(bytes(len(buf)))
+            with memoryview(buf) as view, view[n:] as rest:
+                count = os.preadv(self.fd, [rest], n)
+                short = count < rest.nbytes
+            n += count
+            if not count or (short and not self.multi_record):
+                return n
+
+    def close(self) -> None:
+        """Closes the file descriptor, ignoring errors."""
+        if self.fd < 0:
+            return
+        try:
+            os.close(self.fd)
+        except OSError:
+            pass
+        # Never keep a closed descriptor number around: it may be reused by another file.
+        self.fd = -1
+
+
+@dataclasses.dataclass
+class _ProcFiles:
+    """The /proc files read on every check.
+
+    Attributes:
+        stat (_ProcFile): /proc/stat.
+        meminfo (_ProcFile): /proc/meminfo.
+        diskstats (_ProcFile): /proc/diskstats.
+        netdev (_ProcFile): /proc/net/dev.
+        loadavg (_ProcFile): /proc/loadavg.
+    """
+
+    stat: _ProcFile
+    meminfo: _ProcFile
+    diskstats: _ProcFile
+    netdev: _ProcFile
+    loadavg: _ProcFile
+
+    @classmethod
+    def open(cls) -> "_ProcFiles":
+        """Opens every /proc file used by the monitor.
+
+        Returns:
+            _ProcFiles: The opened files.
+        """
+        return cls(
+            stat=_ProcFile("/proc/stat"),
+            meminfo=_ProcFile("/proc/meminfo"),
+            diskstats=_ProcFile("/proc/diskstats", multi_record=True),
+            netdev=_ProcFile("/proc/net/dev", multi_record=True),
+            loadavg=_ProcFile("/proc/loadavg"),
+        )
+
+    def close(self) -> None:
+        """Closes every file."""
+        for field in dataclasses.fields(self):
+            getattr(self, field.name).close()
+
+
+class _Snapshot:
+    """Raw /proc file contents captured once per check.
+
+    Attributes:
+        stat_buf (memoryview): Contents of /proc/stat.
+        mem_buf (memoryview): Contents of /proc/meminfo.
+        diskstats_buf (memoryview): Contents of /proc/diskstats.
+        netdev_buf (memoryview): Contents of /proc/net/dev.
+        ts (float): Monotonic time at which the snapshot was taken.
+    """
+
+    __slots__ = ("stat_buf", "mem_buf", "diskstats_buf", "netdev_buf", "ts")
+
+    def __init__(
+        self,
+        stat_buf: memoryview,
+        mem_buf: memoryview,
+        diskstats_buf: memoryview,
+        netdev_buf: memoryview,
+        ts: float,
+    ) -> None:
+        """Initializes the snapshot from the raw file contents.
+
+        Args:
+            stat_buf (memoryview): Contents of /proc/stat.
+            mem_buf (memoryview): Contents of /proc/meminfo.
+            diskstats_buf (memoryview): Contents of /proc/diskstats.
+            netdev_buf (memoryview): Contents of /proc/net/dev.
+            ts (float): Monotonic time at which the snapshot was taken.
+        """
+        self.stat_buf = stat_buf
+        self.mem_buf = mem_buf
+        self.diskstats_buf = diskstats_buf
+        self.netdev_buf = netdev_buf
+        self.ts = ts
+
+
+class _RecordBatch:
+    """Log records queued as a single item so they are written together and in order.
+
+    Attributes:
+        records (List[logging.LogRecord]): The records, in the order they are written.
+    """
+
+    __slots__ = ("records",)
+
+    def __init__(self, records: List[logging.LogRecord]) -> None:
+        """Initializes the batch.
+
+        Args:
+            records (List[logging.LogRecord]): The records, in the order they are written.
+        """
+        self.records = records
+
+
+class _WallClockTime:
+    """A wall-clock timestamp rendered only when a log message is formatted.
+
+    Context dump records carry these as arguments, so the timestamps are converted on the
+    ``QueueListener`` thread rather than on the sampling thread building the dump.
+
+    Attributes:
+        ts (float): Seconds since the epoch, as returned by ``time.time()``.
+    """
+
+    __slots__ = ("ts",)
+
+    def __init__(self, ts: float) -> None:
+        """Initializes the timestamp.
+
+        Args:
+            ts (float): Seconds since the epoch, as returned by ``time.time()``.
+        """
+        self.ts = ts
+
+    def __str__(self) -> str:
+        """Renders the timestamp in local time.
+
+        Returns:
+            str: The timestamp formatted with ``_DATE_FORMAT``.
+        """
+        return time.strftime(_DATE_FORMAT, time.localtime(self.ts))
+
+
+class _RingQueueHandler(logging.handlers.QueueHandler):
+    """Queue handler that drops the oldest pending record instead of blocking when full."""
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        """Enqueues a record, evicting the oldest queued record if the queue is full.
+
+        Args:
+            record (logging.LogRecord): The record to enqueue.
+        """
+        while True:
+            try:
+                self.queue.put_nowait(record)
+                return
+            except queue.Full:
+                try:
+                    self.queue.get_nowait()
+                except queue.Empty:
+                    pass
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Passes the record through unformatted.
+
+        The queue never leaves the process and metric arguments are immutable, so message
+        formatting (including rendering ``_WallClockTime`` arguments) is left to the
+        listener thread instead of the sampling thread.
+
+        Args:
+            record (logging.LogRecord): The record to prepare.
+
+        Returns:
+            logging.LogRecord: The unmodified record.
+        """
+        return record
+
+
+class _CachedTimeFormatter(logging.Formatter):
+    """Formatter that renders each second's timestamp once instead of once per record.
+
+    Only the ``QueueListener`` thread formats records, so the cache needs no locking.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        """Initializes the formatter; arguments are passed to ``logging.Formatter``."""
+        super().__init__(*args, **kwargs)
+        self._last_sec = -1
+        self._last_str = ""
+
+    def formatTime(self, record: logging.LogRecord, datefmt: Optional[str] = None) -> str:
+        """Formats the record's creation time, reusing the string rendered for its second.
+
+        Args:
+            record (logging.LogRecord): The record being formatted.
+            datefmt (Optional[str]): strftime format; the default (millisecond) format is
+                not cached.
+
+        Returns:
+            str: The formatted creation time.
+        """
+        if datefmt is None:
+            return super().formatTime(record, datefmt)
+        sec = int(record.created)
+        if sec != self._last_sec:
+            self._last_str = time.strftime(datefmt, self.converter(sec))
+            self._last_sec = sec
+        return self._last_str
+
+
+class _BatchingRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """Rotating file handler that buffers formatted records and writes them in batches.
+
+    ``emit`` only appends to an in-memory buffer; ``flush`` rotates if needed and writes
+    the whole buffer with a single write call. This replaces the per-record stat, seek
+    and write calls of ``RotatingFileHandler`` with one write per batch.
+    """
+
+    # Most records kept for retrying after a failed write; older ones are dropped.
+    _MAX_PENDING = 1024
+
+    def __init__(self, *args, **kwargs) -> None:
+        """Initializes the handler; arguments are passed to ``RotatingFileHandler``."""
+        self._pending: List[str] = []
+        super().__init__(*args, **kwargs)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Formats a record and appends it to the pending batch.
+
+        A record the stream cannot encode is reported and dropped here, as
+        ``RotatingFileHandler`` would, rather than failing the write of the whole batch.
+
+        Args:
+            record (logging.LogRecord): The record to emit.
+        """
+        try:
+            msg = self.format(record) + self.terminator
+            if not msg.isascii():
+                if self.stream is None:
+                    self.stream = self._open()
+                msg.encode(self.stream.encoding, self.stream.errors)
+            self._pending.append(msg)
+        except Exception:
+            self.handleError(record)
+
+    def emit_batch(self, records: List[logging.LogRecord]) -> None:
+        """Formats several records and writes them with a single write call.
+
+        Args:
+            records (List[logging.LogRecord]): The records to write, in order.
+        """
+        self.acquire()
+        try:
+            for record in records:
+                if self.filter(record):
+                    self.emit(record)
+            self.flush()
+        finally:
+            self.release()
+
+    def flush(self) -> None:
+        """Writes all pending records to the log file, rotating first if they would not fit.
+
+        If the write fails, up to ``_MAX_PENDING`` of the newest pending records are kept
+        and retried on the next flush.
+        """
+        self.acquire()
+        try:
+            if not self._pending:
+                return
+            data = "".join(self._pending)
+            if self.stream is None:
+                self.stream = self._open()
+            # As in RotatingFileHandler.shouldRollover, only regular files are rotated:
+            # devices and pipes such as /dev/stdout cannot be sought (bpo-45401).
+            if self.maxBytes > 0 and (
+                not os.path.exists(self.baseFilename) or os.path.isfile(self.baseFilename)
+            ):
+                self.stream.seek(0, os.SEEK_END)
+                position = self.stream.tell()
+                if position and position + len(data) >= self.maxBytes:
+                    self.doRollover()
+            self.stream.write(data)
+            self._pending.clear()
+            self.stream.flush()
+        except Exception:
+            # Mirror Handler.handleError: report the failure without raising, which would
+            # otherwise kill the listener thread.
+            if logging.raiseExceptions:
+                traceback.print_exc(file=sys.stderr)
+            del self._pending[: -self._MAX_PENDING]
+        finally:
+            self.release()
+
+
+class _BatchingQueueListener(logging.handlers.QueueListener):
+    """Queue listener that flushes its handlers once the queue has been drained.
+
+    Records arriving together (such as an anomaly context dump) are written as one batch,
+    while an isolated record is still flushed as soon as it has been handled.
+    """
+
+    def handle(self, record: Union[logging.LogRecord, _RecordBatch]) -> None:
+        """Handles a record or batch and flushes the handlers if no more records are queued.
+
+        Args:
+            record (Union[logging.LogRecord, _RecordBatch]): The record or batch to handle.
+        """
+        if isinstance(record, _RecordBatch):
+            for handler in self.handlers:
+                records = [
+                    batched
+                    for batched in record.records
+                    if not self.respect_handler_level or batched.levelno >= handler.level
+                ]
+                if isinstance(handler, _BatchingRotatingFileHandler):
+                    handler.emit_batch(records)
+                else:
+                    for batched in records:
+                        handler.handle(batched)
+        else:
+            super().handle(record)
+        if self.queue.empty():
+            for handler in self.handlers:
+                handler.flush()
+
+    def stop(self) -> None:
+        """Stops the listener thread and flushes any records still pending."""
+        super().stop()
+        for handler in self.handlers:
+            handler.flush()
+
 
 class SystemMonitor:
     """Monitors system metrics and logs anomalies based on configurable thresholds.
@@ -30,10 +460,106 @@ class SystemMonitor:
         disk_io_threshold (int): Disk I/O delta threshold in bytes.
         net_error_threshold (int): Network error count threshold for delta.
         temp_threshold (float): Temperature threshold in Celsius.
+        temp_sample_divisor (int): Temperatures are read on every Nth check and reused in
+            between.
+        psi_threshold (float): Pressure stall threshold, as the percentage of time stalled
+            over the last 10 seconds (PSI "some avg10").
         interval (float): Interval in seconds between metric checks.
-        previous_metrics (Dict[str, Optional[float]]): Storage for previous metric values to calculate deltas.
+
+    The CPU, memory, load, disk I/O and network error thresholds are bound into the
+    per-check test at construction time, so changing them afterwards has no effect.
     """
 
+    __slots__ = (
+        "cpu_threshold",
+        "memory_threshold",
+        "load_multiplier",
+        "disk_io_threshold",
+        "net_error_threshold",
+        "temp_threshold",
+        "temp_sample_divisor",
+        "psi_threshold",
+        "interval",
+        "_prev_disk_read",
+        "_prev_disk_write",
+        "_prev_errin",
+        "_prev_errout",
+        "_primed",
+        "_prev_disks",
+        "_prev_nics",
+        "_history_info",
+        "_history_warn",
+        "_cpu_count",
+        "_load_threshold",
+        "_check_thresholds",
+        "_temps",
+        "_temp_sensors",
+        "_no_sensors_until",
+        "_tick_counter",
+        "_temps_cached",
+        "_temp_anomalies_cached",
+        "_temp_cache_values",
+        "_temp_cache_repr",
+        "_use_proc",
+        "_proc",
+        "_psi_files",
+        "_block_devices",
+        "_prev_cpu_busy",
+        "_prev_cpu_total",
+        "_vmem",
+        "_disk",
+        "_net",
+        "_cpu_percent",
+        "_logger",
+        "_listener",
+        "_queue_handler",
+    )
+
+    # Line templates for normal samples and anomalies replayed from the history buffers
+    # when an anomaly fires.
+    _CONTEXT_FMT = (
+        "Context %s | CPU: %.1f%% | Memory: %.1f%% | Load Avg (1m): %s | "
+        "Disk Read: %d bytes, Write: %d bytes in interval"
+    )
+    _CONTEXT_ANOMALY_FMT = "Context %s | Anomalies: %s"
+
+    # hwmon inputs, as globbed by psutil; older kernels expose them under "device/".
+    _HWMON_GLOBS = (
+        "/sys/class/hwmon/hwmon*/temp*_input",
+        "/sys/class/hwmon/hwmon*/device/temp*_input",
+    )
+
+    # Seconds to wait before retrying sensors_temperatures() after it found no sensors.
+    _NO_SENSORS_BACKOFF = 60.0
+    # Largest change in °C for which a previously rendered temperature is reused.
+    _TEMP_RENDER_TOLERANCE = 0.5
+
+    # Anomaly message templates and separator.
+    _FMT_CPU = "High CPU usage: %.1f%%"
+    _FMT_MEM = "High Memory usage: %.1f%%"
+    _FMT_LOAD = "High Load Average: %.2f (CPU count: %d)"
+    _FMT_PSI = "High %s pressure: %.2f%% stalled (avg10)"
+    _FMT_TEMP = "High temperature on %s: %.1f°C"
+    _FMT_DISK_READ = "High Disk Read: %d bytes in interval"
+    _FMT_DISK_WRITE = "High Disk Write: %d bytes in interval"
+    _FMT_NET_ERRIN = "High Incoming Network Errors: %d in interval"
+    _FMT_NET_ERROUT = "High Outgoing Network Errors: %d in interval"
+    _FMT_DISK_READ_DEV = "High Disk Read on %s: %d bytes in interval"
+    _FMT_DISK_WRITE_DEV = "High Disk Write on %s: %d bytes in interval"
+    _FMT_NET_ERRIN_DEV = "High Incoming Network Errors on %s: %d in interval"
+    _FMT_NET_ERROUT_DEV = "High Outgoing Network Errors on %s: %d in interval"
+    _SEP = "; "
+
+    # Metrics line template; formatting is deferred to the logging framework.
+    _METRICS_FMT = (
+        "CPU: %.1f%% | "
+        "Memory: %.1f%% used (Total: %d bytes) | "
+        "Disk Read: %d bytes, Write: %d bytes | "
+        "Net Sent: %d bytes, Recv: %d bytes | "
+        "Load Avg (1m): %s | "
+        "Temperatures: %s"
+    )
+
     def __init__(
         self,
         cpu_threshold: float = 90.0,
@@ -42,6 +568,8 @@ class SystemMonitor:
         disk_io_threshold: int = 100 * 1024 * 1024,
         net_error_threshold: int = 10,
         temp_threshold: float = 80.0,
+        temp_sample_divisor: int = 5,
+        psi_threshold: float = 10.0,
         interval: float = 10.0,
         log_file: str = "sysmonitor.log",
     ) -> None:
@@ -54,6 +582,8 @@ class SystemMonitor:
             disk_io_threshold (int): Disk I/O threshold in bytes.
             net_error_threshold (int): Network error threshold.
             temp_threshold (float): Temperature threshold in Celsius.
+            temp_sample_divisor (int): Read temperatures on every Nth check.
+            psi_threshold (float): Pressure stall (PSI avg10) percentage threshold.
             interval (float): Time between metric checks.
             log_file (str): Path to the log file.
         """
@@ -63,33 +593,286 @@ class SystemMonitor:
         self.disk_io_threshold = disk_io_threshold
         self.net_error_threshold = net_error_threshold
         self.temp_threshold = temp_threshold
+        self.temp_sample_divisor = max(1, temp_sample_divisor)
+        self.psi_threshold = psi_threshold
         self.interval = interval
-        self.previous_metrics: Dict[str, Optional[float]] = {
-            "disk_read_bytes": None,
-            "disk_write_bytes": None,
-            "net_errin": None,
-            "net_errout": None,
-        }
+        # Counters from the previous check, used to calculate deltas once primed.
+        self._prev_disk_read = -1
+        self._prev_disk_write = -1
+        self._prev_errin = -1
+        self._prev_errout = -1
+        self._primed = False
+        # Per-device counters from the previous check.
+        self._prev_disks: _DeviceCounters = ((), [], [])
+        self._prev_nics: _DeviceCounters = ((), [], [])
+        # Ring buffers of recent checks, replayed to the log only when an anomaly fires.
+        # Normal samples and anomalies are kept apart so that a long run of normal samples
+        # cannot evict the anomaly history.
+        self._history_info: Deque[_HistoryEntry] = collections.deque(maxlen=512)
+        self._history_warn: Deque[_HistoryEntry] = collections.deque(maxlen=256)
+        # The CPU count is fixed for the lifetime of the process, so derive the load
+        # threshold once instead of on every check.
+        self._cpu_count = psutil.cpu_count() or 1  # Avoid division by zero
+        self._load_threshold = self._cpu_count * self.load_multiplier
+        self._check_thresholds = self._build_threshold_check()
+        # sensors_temperatures is not provided on every platform (e.g. Windows).
+        self._temps = getattr(psutil, "sensors_temperatures", None)
+        self._no_sensors_until = 0.0
+        # Temperatures change over seconds, so readings and their anomalies are reused
+        # between samples taken every temp_sample_divisor checks.
+        self._tick_counter = 0
+        self._temps_cached: _TempReadings = ()
+        self._temp_anomalies_cached: List[str] = []
+        # Last rendered temperature readings and their string form.
+        self._temp_cache_values: _TempReadings = ()
+        self._temp_cache_repr = "N/A"
+        self._use_proc = sys.platform.startswith("linux")
+        # Pressure stall information (Linux 4.20+) measures time tasks actually spent
+        # waiting on CPU, memory or I/O, which load average cannot distinguish.
+        psi_files = []
+        if self._use_proc:
+            for resource in ("cpu", "memory", "io"):
+                try:
+                    psi_files.append(
+                        (resource, _ProcFile(f"/proc/pressure/{resource}", size=256))
+                    )
+                except OSError as e:
+                    logging.debug(
+                        "Pressure stall information for %s not available: %s", resource, e
+                    )
+        self._psi_files: Tuple[Tuple[str, _ProcFile], ...] = tuple(psi_files)
+        if self._use_proc:
+            # Keep the /proc files open and pread() them into per-file buffers on every
+            # check instead of letting psutil reopen and re-parse them for each metric.
+            self._proc = _ProcFiles.open()
+            self._temp_sensors = self._open_hwmon_sensors()
+            # Only whole disks are summed (as psutil does), so partitions are not
+            # double-counted. Maps each diskstats name seen so far to whether it is a
+            # whole disk; new names (e.g. hotplugged disks) are looked up on first sight.
+            self._block_devices: Dict[str, bool] = {}
+            # Record a CPU time baseline so the first check has something to diff against.
+            self._prev_cpu_busy, self._prev_cpu_total = self._parse_cpu_times(
+                self._proc.stat.read()
+            )
+        else:
+            self._temp_sensors = ()
+            # Bind the psutil collectors once to skip module attribute lookups per check.
+            self._vmem = psutil.virtual_memory
+            self._disk = psutil.disk_io_counters
+            self._net = psutil.net_io_counters
+            self._cpu_percent = psutil.cpu_percent
+            # Prime psutil's CPU counters so the first non-blocking read has a baseline.
+            self._cpu_percent(interval=None)
         self._configure_logging(log_file)
 
     def _configure_logging(self, log_file: str) -> None:
-        """Configures logging with a rotating file handler.
+        """Configures logging with a rotating file handler fed by a background thread.
+
+        Records are pushed onto a bounded in-memory queue and written by a
+        ``QueueListener`` thread, so disk stalls (rotation, slow flushes) never block
+        metric collection. When the queue is full the oldest pending record is dropped.
+        The listener drains the queue into a batching handler that writes each burst of
+        records with a single write call.
 
         Args:
             log_file (str): Path to the log file.
         """
         logger = logging.getLogger()
         logger.setLevel(logging.INFO)
+        self._logger = logger
 
         # Set up a rotating file handler: 5 MB per file, up to 5 backups.
-        handler = logging.handlers.RotatingFileHandler(
+        handler = _BatchingRotatingFileHandler(
             log_file, maxBytes=5 * 1024 * 1024, backupCount=5
         )
-        formatter = logging.Formatter(
-            fmt="%(asctime)s %(levelname)s: %(message)s", datefmt="%Y-%m-%d %H:%M:%S"
+        formatter = _CachedTimeFormatter(
+            fmt="%(asctime)s %(levelname)s: %(message)s", datefmt=_DATE_FORMAT
         )
         handler.setFormatter(formatter)
-        logger.addHandler(handler)
+
+        log_queue: "queue.Queue[Union[logging.LogRecord, _RecordBatch]]" = queue.Queue(
+            maxsize=4096
+        )
+        self._listener = _BatchingQueueListener(
+            log_queue, handler, respect_handler_level=True
+        )
+        self._listener.start()
+        self._queue_handler = _RingQueueHandler(log_queue)
+        logger.addHandler(self._queue_handler)
+
+    def _take_snapshot(self) -> _Snapshot:
+        """Reads every /proc file needed for one check, each exactly once.
+
+        Returns:
+            _Snapshot: The raw contents of /proc/stat, /proc/meminfo, /proc/diskstats and
+            /proc/net/dev.
+        """
+        proc = self._proc
+        return _Snapshot(
+            proc.stat.read(),
+            proc.meminfo.read(),
+            proc.diskstats.read(),
+            proc.netdev.read(),
+            time.monotonic(),
+        )
+
+    @staticmethod
+    def _parse_cpu_times(stat_buf: memoryview) -> Tuple[int, int]:
+        """Parses the aggregate CPU busy and total jiffies from /proc/stat contents.
+
+        Args:
+            stat_buf (memoryview): Contents of /proc/stat.
+
+        Returns:
+            Tuple[int, int]: Busy jiffies and total jiffies since boot.
+        """
+        # First line: "cpu user nice system idle iowait irq softirq steal guest guest_nice".
+        # guest time is already included in user time, so only the first eight count.
+        # Only that line is copied out; the rest of the file (per-CPU lines etc.) is never
+        # touched.
+        end = stat_buf.obj.find(b"\n", 0, stat_buf.nbytes)
+        times = [int(value) for value in bytes(stat_buf[: end if end >= 0 else None]).split()[1:9]]
+        total = sum(times)
+        return total - times[3] - times[4], total
+
+    def _parse_cpu(self, snap: _Snapshot) -> float:
+        """Returns CPU usage since the previous snapshot, derived from /proc/stat jiffies.
+
+        Args:
+            snap (_Snapshot): The current snapshot.
+
+        Returns:
+            float: CPU usage percentage.
+        """
+        busy, total = self._parse_cpu_times(snap.stat_buf)
+        busy_delta = busy - self._prev_cpu_busy
+        total_delta = total - self._prev_cpu_total
+        self._prev_cpu_busy, self._prev_cpu_total = busy, total
+        if total_delta <= 0:
+            return 0.0
+        return round(min(max(busy_delta / total_delta * 100.0, 0.0), 100.0), 1)
+
+    @staticmethod
+    def _parse_mem(snap: _Snapshot) -> Tuple[float, int]:
+        """Parses memory usage from the /proc/meminfo contents of a snapshot.
+
+        Args:
+            snap (_Snapshot): The current snapshot.
+
+        Returns:
+            Tuple[float, int]: Used memory percentage and total memory in bytes.
+        """
+        buf = snap.mem_buf
+        # Keys after the first line are anchored on the preceding newline so that, for
+        # example, "Cached:" does not match "SwapCached:".
+        total = _scan_kv(buf, b"MemTotal:")
+        available = _scan_kv(buf, b"\nMemAvailable:")
+        if available < 0:
+            # Kernels older than 3.14 do not report MemAvailable.
+            available = (
+                _scan_kv(buf, b"\nMemFree:")
+                + max(_scan_kv(buf, b"\nBuffers:"), 0)
+                + max(_scan_kv(buf, b"\nCached:"), 0)
+            )
+        percent = round((total - available) / total * 100.0, 1) if total > 0 else 0.0
+        return percent, total * 1024
+
+    def _parse_disk(self, snap: _Snapshot) -> _DeviceCounters:
+        """Parses per-disk I/O counters for whole disks from the /proc/diskstats contents.
+
+        Args:
+            snap (_Snapshot): The current snapshot.
+
+        Returns:
+            _DeviceCounters: Disk names, bytes read per disk and bytes written per disk.
+        """
+        block_devices = self._block_devices
+        names = []
+        read_bytes = []
+        write_bytes = []
+        for line in snap.diskstats_buf.tobytes().splitlines():
+            fields = line.split()
+            if len(fields) < 10:
+                continue
+            name = fields[2].decode()
+            is_disk = block_devices.get(name)
+            if is_disk is None:
+                # /sys/block encodes "/" in device names as "!".
+                is_disk = os.path.exists("/sys/block/" + name.replace("/", "!"))
+                block_devices[name] = is_disk
+            if not is_disk:
+                continue
+            names.append(name)
+            # Sector counts are always reported in 512-byte units.
+            read_bytes.append(int(fields[5]) * 512)
+            write_bytes.append(int(fields[9]) * 512)
+        return tuple(names), read_bytes, write_bytes
+
+    @staticmethod
+    def _parse_net(snap: _Snapshot) -> Tuple[int, int, _DeviceCounters]:
+        """Parses network counters from the /proc/net/dev contents.
+
+        Args:
+            snap (_Snapshot): The current snapshot.
+
+        Returns:
+            Tuple[int, int, _DeviceCounters]: Bytes sent and received across all
+            interfaces, and interface names with incoming and outgoing errors per interface.
+        """
+        bytes_sent = bytes_recv = 0
+        names = []
+        errin = []
+        errout = []
+        # The first two lines are column headers.
+        for line in snap.netdev_buf.tobytes().splitlines()[2:]:
+            name, _, values = line.partition(b":")
+            fields = values.split()
+            bytes_recv += int(fields[0])
+            bytes_sent += int(fields[8])
+            names.append(name.strip().decode())
+            errin.append(int(fields[2]))
+            errout.append(int(fields[10]))
+        return bytes_sent, bytes_recv, (tuple(names), errin, errout)
+
+    def _sample_metrics(
+        self,
+    ) -> Tuple[float, float, int, _DeviceCounters, int, int, _DeviceCounters]:
+        """Collects the raw CPU, memory, disk and network metrics for one check.
+
+        On Linux, each /proc file is read once into a snapshot that all the metrics are
+        parsed from; other platforms fall back to psutil.
+
+        Returns:
+            Tuple: CPU percent, memory percent, total memory, per-disk bytes read and
+            written, network bytes sent, network bytes received, and per-interface incoming
+            and outgoing network errors.
+        """
+        if self._use_proc:
+            snap = self._take_snapshot()
+            cpu_usage = self._parse_cpu(snap)
+            mem_percent, mem_total = self._parse_mem(snap)
+            disks = self._parse_disk(snap)
+            bytes_sent, bytes_recv, nics = self._parse_net(snap)
+        else:
+            # cpu_percent is non-blocking and reports usage since the last call.
+            cpu_usage = self._cpu_percent(interval=None)
+            mem = self._vmem()
+            mem_percent, mem_total = mem.percent, mem.total
+            disk_io = self._disk(perdisk=True)
+            disks = (
+                tuple(disk_io),
+                [counters.read_bytes for counters in disk_io.values()],
+                [counters.write_bytes for counters in disk_io.values()],
+            )
+            net_io = self._net(pernic=True)
+            bytes_sent = sum(counters.bytes_sent for counters in net_io.values())
+            bytes_recv = sum(counters.bytes_recv for counters in net_io.values())
+            nics = (
+                tuple(net_io),
+                [counters.errin for counters in net_io.values()],
+                [counters.errout for counters in net_io.values()],
+            )
+        return cpu_usage, mem_percent, mem_total, disks, bytes_sent, bytes_recv, nics
 
     def get_load_average(self) -> Optional[float]:
         """Returns the system's 1-minute load average.
@@ -98,117 +881,506 @@ class SystemMonitor:
             Optional[float]: The 1-minute load average, or None if unavailable.
         """
         try:
+            if self._use_proc:
+                # "/proc/loadavg" starts with the 1, 5 and 15 minute averages.
+                return float(self._proc.loadavg.read().tobytes().split(None, 1)[0])
             return os.getloadavg()[0]
-        except (AttributeError, OSError) as e:
+        except (AttributeError, OSError, ValueError, IndexError) as e:
             logging.debug("Load average not available: %s", e)
             return None
 
-    def get_temperatures(self) -> Dict[str, float]:
-        """Retrieves temperature readings from available sensors.
+    def _collect_pressure_anomalies(self, anomalies: List[str]) -> None:
+        """Reads pressure stall information and records any resource above the threshold.
+
+        Only the "some avg10" figure is used: the share of the last 10 seconds in which at
+        least one task was stalled on the resource. Files that fail to read are dropped.
+
+        Args:
+            anomalies (List[str]): Anomaly list to append high pressure entries to.
+        """
+        for resource, psi_file in self._psi_files:
+            try:
+                # First line: "some avg10=0.00 avg60=0.00 avg300=0.00 total=0".
+                buf = psi_file.read()
+                start = buf.obj.find(b"avg10=", 0, buf.nbytes)
+                if start < 0:
+                    raise ValueError("avg10 not found")
+                start += 6
+                end = buf.obj.find(b" ", start, buf.nbytes)
+                avg10 = float(buf[start:end])
+            except (OSError, ValueError) as e:
+                logging.debug("Failed to read %s pressure: %s", resource, e)
+                psi_file.close()
+                self._psi_files = tuple(
+                    entry for entry in self._psi_files if entry[1] is not psi_file
+                )
+                continue
+            if avg10 > self.psi_threshold:
+                anomalies.append(self._FMT_PSI % (resource, avg10))
+
+    def _open_hwmon_sensors(self) -> _HwmonSensors:
+        """Discovers hwmon temperature inputs and keeps each one open for re-reading.
+
+        Inputs are grouped by the hwmon device's ``name`` file, which is the sensor name
+        psutil reports, and sorted by it.
+
+        Returns:
+            _HwmonSensors: Sensor names with their open temperature input files.
+        """
+        sensors: Dict[str, List[_ProcFile]] = {}
+        for pattern in self._HWMON_GLOBS:
+            for path in sorted(glob.glob(pattern)):
+                directory = os.path.dirname(path)
+                if directory.endswith("/device"):
+                    directory = os.path.dirname(directory)
+                try:
+                    with open(os.path.join(directory, "name")) as name_file:
+                        name = name_file.read().strip()
+                except OSError:
+                    name = os.path.basename(directory)
+                try:
+                    sensors.setdefault(name, []).append(_ProcFile(path, size=16))
+                except OSError as e:
+                    logging.debug("Failed to open %s: %s", path, e)
+        return tuple((name, tuple(files)) for name, files in sorted(sensors.items()))
+
+    def _read_hwmon_temperatures(self, anomalies: List[str]) -> _TempReadings:
+        """Reads the pre-opened hwmon inputs and records sensors above the threshold.
+
+        Each input holds an ASCII integer in millidegrees Celsius. Inputs that cannot be
+        read (e.g. a disabled sensor) are skipped for this check; inputs that can no longer
+        be opened (e.g. an unplugged sensor) are dropped.
+
+        Args:
+            anomalies (List[str]): Anomaly list to append high temperature entries to.
 
         Returns:
-            Dict[str, float]: A mapping of sensor names to the highest recorded temperature.
+            _TempReadings: ``(sensor, temperature)`` pairs sorted by sensor name, with each
+            sensor's highest temperature rounded to 0.1°C.
         """
-        temp_readings: Dict[str, float] = {}
+        threshold = self.temp_threshold * 1000
+        temp_readings = []
+        removed = False
+        for sensor, inputs in self._temp_sensors:
+            max_millideg = None
+            for temp_input in inputs:
+                try:
+                    millideg = int(temp_input.read())
+                except (OSError, ValueError) as e:
+                    logging.debug("Failed to read %s: %s", temp_input.path, e)
+                    # A failed reopen leaves the input closed.
+                    removed = removed or temp_input.fd < 0
+                    continue
+                if max_millideg is None or millideg > max_millideg:
+                    max_millideg = millideg
+            if max_millideg is None:
+                continue
+            max_temp = max_millideg / 1000
+            temp_readings.append((sensor, round(max_temp, 1)))
+            if max_millideg > threshold:
+                anomalies.append(self._FMT_TEMP % (sensor, max_temp))
+        if removed:
+            sensors = (
+                (sensor, tuple(temp_input for temp_input in inputs if temp_input.fd >= 0))
+                for sensor, inputs in self._temp_sensors
+            )
+            self._temp_sensors = tuple((sensor, inputs) for sensor, inputs in sensors if inputs)
+        return tuple(temp_readings)
+
+    def _collect_temperature_anomalies(self, anomalies: List[str]) -> _TempReadings:
+        """Reads temperature sensors and records any that exceed the threshold.
+
+        On Linux, pre-opened hwmon inputs are read directly when any were found; otherwise
+        psutil is used. Each sensor's entries are scanned once, tracking the maximum and
+        checking it against the threshold in the same pass. When psutil reports no
+        sensors, reads are suspended for ``_NO_SENSORS_BACKOFF`` seconds rather than
+        retried on every check.
+
+        Args:
+            anomalies (List[str]): Anomaly list to append high temperature entries to.
+
+        Returns:
+            _TempReadings: ``(sensor, temperature)`` pairs sorted by sensor name, with each
+            sensor's highest temperature rounded to 0.1°C.
+        """
+        if self._temp_sensors:
+            return self._read_hwmon_temperatures(anomalies)
+        if self._temps is None or time.monotonic() < self._no_sensors_until:
+            return ()
         try:
-            temps = psutil.sensors_temperatures()
-            if not temps:
-                return temp_readings
-            for sensor, entries in temps.items():
-                if entries:
-                    # Choose the highest temperature from all entries for this sensor.
-                    max_temp = max(entry.current for entry in entries)
-                    temp_readings[sensor] = max_temp
+            temps = self._temps()
         except Exception as e:
             logging.debug("Failed to get temperatures: %s", e)
-        return temp_readings
+            temps = None
+        if not temps:
+            self._no_sensors_until = time.monotonic() + self._NO_SENSORS_BACKOFF
+            return ()
+        threshold = self.temp_threshold
+        temp_readings = []
+        for sensor, entries in sorted(temps.items()):
+            if not entries:
+                continue
+            # Choose the highest temperature from all entries for this sensor.
+            max_temp = entries[0].current
+            for entry in entries:
+                if entry.current > max_temp:
+                    max_temp = entry.current
+            temp_readings.append((sensor, round(float(max_temp), 1)))
+            if max_temp > threshold:
+                anomalies.append(self._FMT_TEMP % (sensor, max_temp))
+        return tuple(temp_readings)
+
+    def _render_temperatures(self, readings: _TempReadings) -> str:
+        """Renders temperature readings for the metrics line, reusing the last rendering.
+
+        Temperatures drift slowly, so the cached string is kept until a sensor appears,
+        disappears or moves more than ``_TEMP_RENDER_TOLERANCE`` from its rendered value.
+
+        Args:
+            readings (_TempReadings): Readings from ``_collect_temperature_anomalies``.
+
+        Returns:
+            str: Comma-separated ``sensor=temperature`` pairs, or "N/A" without readings.
+        """
+        cached = self._temp_cache_values
+        if len(readings) == len(cached):
+            tolerance = self._TEMP_RENDER_TOLERANCE
+            for (sensor, temp), (cached_sensor, cached_temp) in zip(readings, cached):
+                if sensor != cached_sensor or abs(temp - cached_temp) > tolerance:
+                    break
+            else:
+                return self._temp_cache_repr
+        self._temp_cache_values = readings
+        self._temp_cache_repr = (
+            ", ".join(f"{sensor}={temp}" for sensor, temp in readings) if readings else "N/A"
+        )
+        return self._temp_cache_repr
 
-    def log_system_metrics(self) -> None:
-        """Captures, analyzes, and logs system metrics along with any detected anomalies."""
-        start_time = time.time()
+    def _build_threshold_check(self) -> Callable[..., List[str]]:
+        """Builds the per-check threshold test, specialized for this monitor's configuration.
 
-        # Collect metrics. Note that cpu_percent blocks for 1 second.
-        cpu_usage = psutil.cpu_percent(interval=1)
-        mem = psutil.virtual_memory()
-        disk_io = psutil.disk_io_counters()
-        net_io = psutil.net_io_counters()
+        Thresholds and message templates are bound as closure constants, so the returned
+        function runs the checks straight-line without any attribute lookups on ``self``.
+
+        Disk I/O and network errors are attributed to individual devices while the set of
+        devices is unchanged since the previous check. A total is only reported when no
+        single device exceeds the threshold, so one busy device is not reported twice.
+
+        Returns:
+            Callable[..., List[str]]: A function taking CPU percent, memory percent, load
+            average, whether deltas are valid, the disk read, disk write, incoming and
+            outgoing network error deltas, and the current and previous per-disk and
+            per-interface counters, and returning the detected anomalies.
+        """
+        cpu_threshold = self.cpu_threshold
+        memory_threshold = self.memory_threshold
+        load_threshold = self._load_threshold
+        cpu_count = self._cpu_count
+        disk_io_threshold = self.disk_io_threshold
+        net_error_threshold = self.net_error_threshold
+        fmt_cpu = self._FMT_CPU
+        fmt_mem = self._FMT_MEM
+        fmt_load = self._FMT_LOAD
+        fmt_disk_read = self._FMT_DISK_READ
+        fmt_disk_write = self._FMT_DISK_WRITE
+        fmt_net_errin = self._FMT_NET_ERRIN
+        fmt_net_errout = self._FMT_NET_ERROUT
+        fmt_disk_read_dev = self._FMT_DISK_READ_DEV
+        fmt_disk_write_dev = self._FMT_DISK_WRITE_DEV
+        fmt_net_errin_dev = self._FMT_NET_ERRIN_DEV
+        fmt_net_errout_dev = self._FMT_NET_ERROUT_DEV
+
+        def check_counter(
+            anomalies: List[str],
+            total_delta: int,
+            names: Optional[Tuple[str, ...]],
+            current: List[int],
+            previous: List[int],
+            threshold: int,
+            fmt_total: str,
+            fmt_device: str,
+        ) -> None:
+            # names is None when the devices changed and per-device deltas are invalid.
+            count = len(anomalies)
+            if names is not None:
+                for name, value, previous_value in zip(names, current, previous):
+                    delta = value - previous_value
+                    if delta > threshold:
+                        anomalies.append(fmt_device % (name, delta))
+            if len(anomalies) == count and total_delta > threshold:
+                anomalies.append(fmt_total % total_delta)
+
+        def check_thresholds(
+            cpu_usage: float,
+            mem_percent: float,
+            load_avg: Optional[float],
+            primed: bool,
+            disk_read_delta: int,
+            disk_write_delta: int,
+            net_errin_delta: int,
+            net_errout_delta: int,
+            disks: _DeviceCounters,
+            prev_disks: _DeviceCounters,
+            nics: _DeviceCounters,
+            prev_nics: _DeviceCounters,
+        ) -> List[str]:
+            anomalies: List[str] = []
+            if cpu_usage > cpu_threshold:
+                anomalies.append(fmt_cpu % cpu_usage)
+            if mem_percent > memory_threshold:
+                anomalies.append(fmt_mem % mem_percent)
+            if load_avg is not None and load_avg > load_threshold:
+                anomalies.append(fmt_load % (load_avg, cpu_count))
+            if primed:
+                disk_names, disk_reads, disk_writes = disks
+                _, prev_disk_reads, prev_disk_writes = prev_disks
+                names = disk_names if disk_names == prev_disks[0] else None
+                check_counter(
+                    anomalies,
+                    disk_read_delta,
+                    names,
+                    disk_reads,
+                    prev_disk_reads,
+                    disk_io_threshold,
+                    fmt_disk_read,
+                    fmt_disk_read_dev,
+                )
+                check_counter(
+                    anomalies,
+                    disk_write_delta,
+                    names,
+                    disk_writes,
+                    prev_disk_writes,
+                    disk_io_threshold,
+                    fmt_disk_write,
+                    fmt_disk_write_dev,
+                )
+                nic_names, nic_errin, nic_errout = nics
+                _, prev_nic_errin, prev_nic_errout = prev_nics
+                names = nic_names if nic_names == prev_nics[0] else None
+                check_counter(
+                    anomalies,
+                    net_errin_delta,
+                    names,
+                    nic_errin,
+                    prev_nic_errin,
+                    net_error_threshold,
+                    fmt_net_errin,
+                    fmt_net_errin_dev,
+                )
+                check_counter(
+                    anomalies,
+                    net_errout_delta,
+                    names,
+                    nic_errout,
+                    prev_nic_errout,
+                    net_error_threshold,
+                    fmt_net_errout,
+                    fmt_net_errout_dev,
+                )
+            return anomalies
+
+        return check_thresholds
+
+    def _dump_history(self) -> None:
+        """Logs the buffered checks leading up to an anomaly, then clears the buffers.
+
+        Both buffers are merged in monotonic order, so earlier anomalies appear interleaved
+        with the normal samples around them. A dump only happens at the onset of an
+        anomaly (when normal samples have been seen since the last dump), so a sustained
+        anomaly does not replay history on every check.
+
+        The dump bypasses ``Logger.handle``: the monitor's queue handler receives it as a
+        single ``_RecordBatch``, and any other handler on the logger receives its records
+        one by one. Each handler's level and filters are still applied.
+        """
+        if not self._history_info:
+            return
+        logger = self._logger
+        if logger.isEnabledFor(logging.WARNING):
+            # The dump is queued as one batch so it reaches the log file with a single
+            # write, in order, and cannot be partially evicted from the log queue.
+            def make_record(msg: str, args: Tuple[Any, ...] = ()) -> logging.LogRecord:
+                return logger.makeRecord(
+                    logger.name, logging.WARNING, __file__, 0, msg, args, None
+                )
+
+            records = [make_record("--- context dump start ---")]
+            # Both buffers are already in monotonic order; only the timestamps are compared.
+            for _, fmt, args in heapq.merge(
+                self._history_info, self._history_warn, key=operator.itemgetter(0)
+            ):
+                records.append(make_record(fmt, args))
+            records.append(make_record("--- context dump end ---"))
+            for handler in logger.handlers:
+                if logging.WARNING < handler.level:
+                    continue
+                if handler is self._queue_handler:
+                    accepted = [record for record in records if handler.filter(record)]
+                    if accepted:
+                        handler.enqueue(_RecordBatch(accepted))
+                else:
+                    for record in records:
+                        handler.handle(record)
+        self._history_info.clear()
+        self._history_warn.clear()
+
+    def check_system_metrics(self) -> None:
+        """Captures, analyzes, and logs system metrics along with any detected anomalies.
+
+        Performs a single check and returns immediately; scheduling is left to ``run``.
+
+        CPU usage is sampled without blocking, so the reported percentage is averaged over
+        the time since the previous check (roughly ``self.interval`` seconds) rather than
+        over a fixed 1-second window.
+        """
+        # Rendered only if this check is replayed in a context dump.
+        timestamp = _WallClockTime(time.time())
+
+        # Collect metrics.
+        (
+            cpu_usage,
+            mem_percent,
+            mem_total,
+            disks,
+            net_bytes_sent,
+            net_bytes_recv,
+            nics,
+        ) = self._sample_metrics()
         load_avg = self.get_load_average()
-        temperatures = self.get_temperatures()
-
-        anomalies = []
-
-        # Detect high CPU usage.
-        if cpu_usage > self.cpu_threshold:
-            anomalies.append(f"High CPU usage: {cpu_usage:.1f}%")
-
-        # Detect high memory usage.
-        if mem.percent > self.memory_threshold:
-            anomalies.append(f"High Memory usage: {mem.percent:.1f}%")
-
-        # Detect high load average relative to CPU count.
-        if load_avg is not None:
-            cpu_count = psutil.cpu_count() or 1  # Avoid division by zero
-            if load_avg > cpu_count * self.load_multiplier:
-                anomalies.append(f"High Load Average: {load_avg:.2f} (CPU count: {cpu_count})")
-
-        # Detect high temperatures.
-        for sensor, temp in temperatures.items():
-            if temp > self.temp_threshold:
-                anomalies.append(f"High temperature on {sensor}: {temp:.1f}°C")
-
-        # Calculate disk I/O deltas.
-        if self.previous_metrics["disk_read_bytes"] is not None:
-            disk_read_delta = disk_io.read_bytes - self.previous_metrics["disk_read_bytes"]
-            disk_write_delta = disk_io.write_bytes - self.previous_metrics["disk_write_bytes"]
-            if disk_read_delta > self.disk_io_threshold:
-                anomalies.append(f"High Disk Read: {disk_read_delta} bytes in interval")
-            if disk_write_delta > self.disk_io_threshold:
-                anomalies.append(f"High Disk Write: {disk_write_delta} bytes in interval")
-        # Update disk I/O baseline.
-        self.previous_metrics["disk_read_bytes"] = disk_io.read_bytes
-        self.previous_metrics["disk_write_bytes"] = disk_io.write_bytes
-
-        # Calculate network error deltas.
-        if self.previous_metrics["net_errin"] is not None:
-            net_errin_delta = net_io.errin - self.previous_metrics["net_errin"]
-            net_errout_delta = net_io.errout - self.previous_metrics["net_errout"]
-            if net_errin_delta > self.net_error_threshold:
-                anomalies.append(f"High Incoming Network Errors: {net_errin_delta} in interval")
-            if net_errout_delta > self.net_error_threshold:
-                anomalies.append(f"High Outgoing Network Errors: {net_errout_delta} in interval")
-        # Update network error baseline.
-        self.previous_metrics["net_errin"] = net_io.errin
-        self.previous_metrics["net_errout"] = net_io.errout
-
-        # Compose the log message.
-        log_message = (
-            f"CPU: {cpu_usage:.1f}% | "
-            f"Memory: {mem.percent:.1f}% used (Total: {mem.total} bytes) | "
-            f"Disk Read: {disk_io.read_bytes} bytes, Write: {disk_io.write_bytes} bytes | "
-            f"Net Sent: {net_io.bytes_sent} bytes, Recv: {net_io.bytes_recv} bytes | "
-            f"Load Avg (1m): {load_avg if load_avg is not None else 'N/A'} | "
-            f"Temperatures: {temperatures}"
+        disk_read_bytes = sum(disks[1])
+        disk_write_bytes = sum(disks[2])
+        net_errin = sum(nics[1])
+        net_errout = sum(nics[2])
+
+        # Calculate disk I/O and network error deltas against the previous check.
+        primed = self._primed
+        disk_read_delta = disk_write_delta = net_errin_delta = net_errout_delta = 0
+        if primed:
+            disk_read_delta = disk_read_bytes - self._prev_disk_read
+            disk_write_delta = disk_write_bytes - self._prev_disk_write
+            net_errin_delta = net_errin - self._prev_errin
+            net_errout_delta = net_errout - self._prev_errout
+        # Update baselines.
+        self._prev_disk_read = disk_read_bytes
+        self._prev_disk_write = disk_write_bytes
+        self._prev_errin = net_errin
+        self._prev_errout = net_errout
+        self._primed = True
+
+        # Detect CPU, memory, load average, disk I/O and network error anomalies, overall
+        # and per device.
+        anomalies = self._check_thresholds(
+            cpu_usage,
+            mem_percent,
+            load_avg,
+            primed,
+            disk_read_delta,
+            disk_write_delta,
+            net_errin_delta,
+            net_errout_delta,
+            disks,
+            self._prev_disks,
+            nics,
+            self._prev_nics,
         )
+        self._prev_disks = disks
+        self._prev_nics = nics
+
+        # Detect CPU, memory and I/O pressure stalls.
+        self._collect_pressure_anomalies(anomalies)
 
+        # Read temperatures every Nth check, recording any above the threshold.
+        if self._tick_counter % self.temp_sample_divisor == 0:
+            temp_anomalies: List[str] = []
+            self._temps_cached = self._collect_temperature_anomalies(temp_anomalies)
+            self._temp_anomalies_cached = temp_anomalies
+        self._tick_counter += 1
+        anomalies.extend(self._temp_anomalies_cached)
+        temperatures_repr = self._render_temperatures(self._temps_cached)
+
+        # Log the metrics; the message is only rendered if a handler emits it.
+        logger = self._logger
+        anomaly_text = self._SEP.join(anomalies) if anomalies else ""
+        if anomalies or logger.isEnabledFor(logging.INFO):
+            metrics = (
+                cpu_usage,
+                mem_percent,
+                mem_total,
+                disk_read_bytes,
+                disk_write_bytes,
+                net_bytes_sent,
+                net_bytes_recv,
+                load_avg if load_avg is not None else "N/A",
+                temperatures_repr,
+            )
+            if anomalies:
+                self._dump_history()
+                logger.warning(self._METRICS_FMT + " | Anomalies: %s", *metrics, anomaly_text)
+            else:
+                logger.info(self._METRICS_FMT, *metrics)
+
+        # Buffer this check for future context dumps.
         if anomalies:
-            log_message += " | Anomalies: " + "; ".join(anomalies)
-            logging.warning(log_message)
+            self._history_warn.append(
+                (
+                    time.monotonic_ns(),
+                    self._CONTEXT_ANOMALY_FMT,
+                    (timestamp, anomaly_text),
+                )
+            )
         else:
-            logging.info(log_message)
+            self._history_info.append(
+                (
+                    time.monotonic_ns(),
+                    self._CONTEXT_FMT,
+                    (
+                        timestamp,
+                        cpu_usage,
+                        mem_percent,
+                        load_avg if load_avg is not None else "N/A",
+                        disk_read_delta,
+                        disk_write_delta,
+                    ),
+                )
+            )
 
-        # Adjust sleep to maintain consistent intervals despite measurement time.
-        elapsed = time.time() - start_time
-        sleep_time = max(0, self.interval - elapsed)
-        time.sleep(sleep_time)
+    def _close_files(self) -> None:
+        """Closes the pre-opened /proc, hwmon and pressure stall files."""
+        if self._use_proc:
+            self._proc.close()
+            for _, inputs in self._temp_sensors:
+                for temp_input in inputs:
+                    temp_input.close()
+        for _, psi_file in self._psi_files:
+            psi_file.close()
+        self._psi_files = ()
 
     def run(self) -> None:
-        """Starts the continuous monitoring loop until interrupted."""
+        """Starts the continuous monitoring loop until interrupted.
+
+        Checks are scheduled against absolute monotonic deadlines, so the average rate stays
+        at one check per ``self.interval`` regardless of per-check jitter or wall-clock
+        adjustments. If a check overruns its deadline, the schedule resynchronizes to now
+        instead of firing a burst of catch-up checks.
+        """
         logging.info("Starting system monitoring with interval: %s seconds.", self.interval)
         try:
+            next_tick = time.monotonic()
             while True:
-                self.log_system_metrics()
+                self.check_system_metrics()
+                next_tick += self.interval
+                delay = next_tick - time.monotonic()
+                if delay > 0:
+                    time.sleep(delay)
+                else:
+                    next_tick = time.monotonic()
         except KeyboardInterrupt:
             logging.info("Monitoring stopped by user.")
+        finally:
+            self._close_files()
+            # Flush any queued records to disk before exiting.
+            self._listener.stop()
 
 
 def parse_arguments() -> argparse.Namespace:
@@ -256,6 +1428,19 @@ def parse_arguments() -> argparse.Namespace:
         default=80.0,
         help="Temperature threshold in Celsius (default: 80°C)",
     )
+    parser.add_argument(
+        "--temp_sample_divisor",
+        type=int,
+        default=5,
+        help="Read temperatures on every Nth check and reuse them in between (default: 5)",
+    )
+    parser.add_argument(
+        "--psi_threshold",
+        type=float,
+        default=10.0,
+        help="Pressure stall (PSI avg10) percentage threshold for CPU, memory and I/O "
+        "(default: 10)",
+    )
     parser.add_argument(
         "--interval",
         type=float,
@@ -281,6 +1466,8 @@ def main() -> None:
         disk_io_threshold=args.disk_io_threshold,
         net_error_threshold=args.net_error_threshold,
         temp_threshold=args.temp_threshold,
+        temp_sample_divisor=args.temp_sample_divisor,
+        psi_threshold=args.psi_threshold,
         interval=args.interval,
         log_file=args.log_file,
     )